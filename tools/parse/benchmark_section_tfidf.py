@@ -0,0 +1,171 @@
+"""Benchmark the TF-IDF index against the app's FTS5 search.
+
+Rebuilds the app's sections / sections_fts tables in an in-memory SQLite
+database and runs the same AND-then-OR query DatabaseService.search uses
+(src/db/database.ts). Reports queries/sec for both backends and recall@k of
+the TF-IDF results against the FTS results.
+
+    python tools/parse/section_tfidf.py            # build the index first
+    python tools/parse/benchmark_section_tfidf.py [sample_size]
+"""
+
+import random
+import re
+import sqlite3
+import sys
+import time
+
+from law_corpus import LawCorpus
+from section_tfidf import OUTPUT_PATH, STOP_WORDS, SectionTfidfIndex
+
+K = 12  # APP_CONFIG.AI.CONTEXT_SIZE
+DEFAULT_SAMPLE_SIZE = 500
+SEED = 0
+
+# Keyword-style queries, like the ones AIService.extractSearchKeywords produces.
+QUERIES = [
+    "freedom of expression",
+    "right to vote election",
+    "arrest without warrant police",
+    "bail murder charge",
+    "fundamental rights protection",
+    "citizenship registration",
+    "president powers removal",
+    "land lease tenancy eviction",
+    "rent increase landlord",
+    "minimum wage employee",
+    "termination of employment severance",
+    "divorce custody children",
+    "domestic violence protection order",
+    "marriage registration",
+    "income tax return penalty",
+    "customs import duty",
+    "company director liability",
+    "drug possession trafficking",
+    "theft larceny punishment",
+    "motor vehicle licence driving",
+    "firearm licence",
+    "mining licence gold",
+    "forest concession",
+    "amerindian village land title",
+    "public health nuisance",
+    "consumer complaint refund",
+    "freedom of religion",
+    "ombudsman complaint",
+    "parliament dissolution",
+    "court of appeal jurisdiction",
+]
+
+
+def build_fts(corpus: LawCorpus, chunk_ids: set[str]) -> sqlite3.Connection:
+    db = sqlite3.connect(":memory:")
+    db.executescript(
+        """
+        CREATE TABLE sections (
+          id INTEGER PRIMARY KEY AUTOINCREMENT,
+          doc_id TEXT NOT NULL,
+          chunk_id TEXT NOT NULL UNIQUE,
+          section_number TEXT NOT NULL,
+          heading TEXT,
+          text TEXT NOT NULL
+        );
+        CREATE VIRTUAL TABLE sections_fts USING fts5(
+          chunk_id UNINDEXED,
+          section_number,
+          heading,
+          text,
+          content=sections,
+          content_rowid=id
+        );
+        """
+    )
+    rows = {}
+    for section in corpus.iter_sections():
+        if section["chunk_id"] in chunk_ids:
+            rows[section["chunk_id"]] = section
+    db.executemany(
+        "INSERT INTO sections (doc_id, chunk_id, section_number, heading, text) VALUES (?, ?, ?, ?, ?)",
+        [
+            (s["doc_id"], s["chunk_id"], str(s.get("section_number") or ""), s.get("heading"), s.get("text") or "")
+            for s in rows.values()
+        ],
+    )
+    db.execute("INSERT INTO sections_fts(sections_fts) VALUES ('rebuild')")
+    return db
+
+
+def fts_search(db: sqlite3.Connection, query: str, constitution_doc_id: str, limit: int) -> list[str]:
+    terms = [
+        '"' + term.replace('"', '""') + '"'
+        for term in re.sub(r"[^\w\s]", " ", query.lower()).split()
+        if len(term) >= 3 and term not in STOP_WORDS
+    ]
+    if not terms:
+        return []
+
+    or_query = " OR ".join(terms)
+    and_query = " AND ".join(terms) if len(terms) > 1 else or_query
+    sql = """
+        SELECT s.chunk_id
+          FROM sections s
+          INNER JOIN sections_fts fts ON s.id = fts.rowid
+         WHERE sections_fts MATCH ?
+         ORDER BY CASE WHEN s.doc_id = ? THEN 0 ELSE 1 END, rank
+         LIMIT ?
+    """
+    rows = db.execute(sql, (and_query, constitution_doc_id, limit)).fetchall()
+    if not rows and and_query != or_query:
+        rows = db.execute(sql, (or_query, constitution_doc_id, limit)).fetchall()
+    return [row[0] for row in rows]
+
+
+def recall(expected: list[list[str]], actual: list[list[str]]) -> tuple[float, int]:
+    scores = [
+        len(set(want) & set(got)) / len(want)
+        for want, got in zip(expected, actual)
+        if want
+    ]
+    return (sum(scores) / len(scores) if scores else 0.0), len(scores)
+
+
+def main() -> None:
+    sample_size = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SAMPLE_SIZE
+
+    index = SectionTfidfIndex.load(OUTPUT_PATH)
+    with LawCorpus() as corpus:
+        db = build_fts(corpus, set(index.chunk_ids.tolist()))
+        constitution_doc_id = corpus.constitution_doc_id
+        headings = sorted({
+            s["heading"].strip()
+            for s in corpus.iter_sections()
+            if s.get("heading") and len(s["heading"].split()) >= 3
+        })
+
+    sampled = random.Random(SEED).sample(headings, min(sample_size, len(headings)))
+    queries = QUERIES + sampled
+    print(f"queries: {len(queries)} ({len(QUERIES)} keyword, {len(sampled)} heading samples)")
+    print(f"sections: {index.matrix.shape[0]}")
+
+    started = time.perf_counter()
+    fts_results = [fts_search(db, q, constitution_doc_id, K) for q in queries]
+    fts_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    hits = index.query(queries, k=K)
+    tfidf_elapsed = time.perf_counter() - started
+    tfidf_results = [[hit.chunk_id for hit in row] for row in hits]
+
+    print(f"\nFTS5   : {len(queries) / fts_elapsed:10.1f} queries/sec")
+    print(f"TF-IDF : {len(queries) / tfidf_elapsed:10.1f} queries/sec (batched)")
+
+    keyword_recall, keyword_n = recall(fts_results[:len(QUERIES)], tfidf_results[:len(QUERIES)])
+    sample_recall, sample_n = recall(fts_results[len(QUERIES):], tfidf_results[len(QUERIES):])
+    total_recall, total_n = recall(fts_results, tfidf_results)
+    print(f"\nrecall@{K} vs FTS (queries with FTS hits)")
+    print(f"  keyword queries : {keyword_recall:.3f} (n={keyword_n})")
+    print(f"  heading samples : {sample_recall:.3f} (n={sample_n})")
+    print(f"  overall         : {total_recall:.3f} (n={total_n})")
+
+
+if __name__ == "__main__":
+    main()
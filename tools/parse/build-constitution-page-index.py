@@ -5,10 +5,11 @@ from urllib.request import urlretrieve
 
 from pypdf import PdfReader
 
+from law_corpus import LawCorpus
+
 ROOT = Path(__file__).resolve().parents[2]
 CONSTANTS_PATH = ROOT / "src" / "constants" / "index.ts"
 URLS_PATH = ROOT / "src" / "assets" / "acts-pdf-urls.json"
-CONSTITUTION_JSON_PATH = ROOT / "src" / "assets" / "constitution.json"
 OUTPUT_PATH = ROOT / "src" / "assets" / "constitution-page-index.json"
 TMP_DIR = ROOT / "tools" / "tmp"
 TMP_PDF_PATH = TMP_DIR / "constitution.pdf"
@@ -58,8 +59,9 @@ def load_pdf_url(pdf_path: str) -> str:
 
 
 def load_section_numbers() -> set[str]:
-    data = json.loads(CONSTITUTION_JSON_PATH.read_text(encoding="utf-8"))
-    return {str(section["section_number"]).upper() for section in data["sections"]}
+    with LawCorpus() as corpus:
+        sections = corpus.iter_sections(corpus.constitution_doc_id)
+        return {str(section["section_number"]).upper() for section in sections}
 
 
 def download_pdf(url: str) -> None:
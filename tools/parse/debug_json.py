@@ -1,10 +1,7 @@
-import json
-from pathlib import Path
+from law_corpus import LawCorpus
 
-ROOT = Path(__file__).resolve().parents[2]
-p = ROOT / "src" / "assets" / "constitution.json"
-data = json.loads(p.read_text(encoding="utf-8"))
-secs = data["sections"]
+with LawCorpus() as corpus:
+    secs = list(corpus.iter_sections(corpus.constitution_doc_id))
 
 bad = []
 for s in secs:
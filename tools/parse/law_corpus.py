@@ -0,0 +1,230 @@
+"""Read-only access to the generated law corpus in src/assets.
+
+Document metadata is loaded eagerly. The Acts section shards
+(src/assets/chunks/acts-sections-*.json) are memory-mapped and indexed by
+byte offset, so individual sections are only decoded when asked for and
+recently used ones are kept in a bounded LRU cache.
+
+    from law_corpus import LawCorpus
+
+    with LawCorpus() as corpus:
+        section = corpus.get_section("act-001-08-s2")
+        for s in corpus.iter_sections("guyana-constitution"):
+            ...
+"""
+
+import json
+import mmap
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator, NamedTuple
+
+ROOT = Path(__file__).resolve().parents[2]
+ASSETS_DIR = ROOT / "src" / "assets"
+
+DEFAULT_CACHE_SIZE = 4096
+
+# split-json.js writes each shard with JSON.stringify, so every section object
+# starts with these two keys in this order and objects are separated by ",".
+SECTION_START_RE = re.compile(rb'\{"doc_id":"([^"]*)","chunk_id":"([^"]*)"')
+
+
+class SectionSpan(NamedTuple):
+    shard: int
+    start: int
+    end: int
+
+
+class LawCorpus:
+    def __init__(
+        self,
+        assets_dir: Path = ASSETS_DIR,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        include_constitution: bool = True,
+    ) -> None:
+        self.assets_dir = Path(assets_dir)
+        self.chunks_dir = self.assets_dir / "chunks"
+
+        index = json.loads((self.chunks_dir / "index.json").read_text(encoding="utf-8"))
+        metadata = json.loads((self.chunks_dir / index["metadataFile"]).read_text(encoding="utf-8"))
+        self.total_act_sections: int = index["totalSections"]
+        self.stats: dict = metadata.get("stats", {})
+        self.documents: dict[str, dict] = {doc["doc_id"]: doc for doc in metadata["documents"]}
+
+        self._shard_paths = [
+            self.chunks_dir / f"acts-sections-{n}.json" for n in range(1, index["sectionChunks"] + 1)
+        ]
+        self._files: list = []
+        self._maps: list[mmap.mmap] = []
+        self._by_chunk_id: dict[str, SectionSpan] | None = None
+        self._by_doc_id: dict[str, list[SectionSpan]] = {}
+
+        # The Constitution is a single small, pretty-printed file, so it is
+        # parsed up front with the metadata rather than indexed by offset.
+        self._constitution_path = self.assets_dir / "constitution.json"
+        self._constitution: dict | None = None
+        self.constitution_doc_id: str | None = None
+        if include_constitution and self._constitution_path.exists():
+            self._load_constitution()
+
+        self._decode = lru_cache(maxsize=cache_size)(self._decode_span)
+
+    # -- lifecycle ---------------------------------------------------------
+
+    def close(self) -> None:
+        for mm in self._maps:
+            mm.close()
+        for f in self._files:
+            f.close()
+        self._maps = []
+        self._files = []
+        self._by_chunk_id = None
+        self._by_doc_id = {}
+        self._decode.cache_clear()
+
+    def __enter__(self) -> "LawCorpus":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # -- indexing ----------------------------------------------------------
+
+    def _open_shards(self) -> None:
+        for path in self._shard_paths:
+            f = path.open("rb")
+            self._files.append(f)
+            self._maps.append(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def _build_index(self) -> dict[str, SectionSpan]:
+        if self._by_chunk_id is not None:
+            return self._by_chunk_id
+
+        if not self._maps:
+            self._open_shards()
+
+        # Some Acts repeat chunk_ids. Later spans overwrite earlier ones, matching
+        # the INSERT OR REPLACE import into the app's sections table.
+        by_chunk_id: dict[str, SectionSpan] = {}
+        by_doc_id: dict[str, list[SectionSpan]] = {}
+        span_count = 0
+        for shard, mm in enumerate(self._maps):
+            matches = list(SECTION_START_RE.finditer(mm))
+            array_end = mm.rfind(b"]")
+            for i, match in enumerate(matches):
+                end = matches[i + 1].start() - 1 if i + 1 < len(matches) else array_end
+                span = SectionSpan(shard, match.start(), end)
+                by_chunk_id[match.group(2).decode("utf-8")] = span
+                by_doc_id.setdefault(match.group(1).decode("utf-8"), []).append(span)
+            span_count += len(matches)
+
+        if span_count != self.total_act_sections:
+            raise RuntimeError(
+                f"Indexed {span_count} sections but index.json lists {self.total_act_sections}. "
+                "Regenerate the chunks with tools/import/split-json.js."
+            )
+
+        self._by_chunk_id = by_chunk_id
+        self._by_doc_id = by_doc_id
+        return by_chunk_id
+
+    def _decode_span(self, span: SectionSpan) -> dict:
+        return json.loads(self._maps[span.shard][span.start:span.end])
+
+    def _load_constitution(self) -> None:
+        data = json.loads(self._constitution_path.read_text(encoding="utf-8"))
+        sections = data.get("sections", [])
+        by_chunk_id = {}
+        for ordinal, section in enumerate(sections, start=1):
+            section = {"doc_id": data["doc_id"], **section, "ordinal": ordinal}
+            sections[ordinal - 1] = section
+            by_chunk_id[section["chunk_id"]] = section
+        self._constitution = {"sections": sections, "by_chunk_id": by_chunk_id}
+        self.constitution_doc_id = data["doc_id"]
+        self.documents.setdefault(
+            data["doc_id"],
+            {"doc_id": data["doc_id"], "doc_type": "constitution", "title": data.get("title")},
+        )
+
+    # -- lookups -----------------------------------------------------------
+
+    def get_document(self, doc_id: str) -> dict | None:
+        return self.documents.get(doc_id)
+
+    def get_section(self, chunk_id: str) -> dict | None:
+        """Return one section by chunk_id, or None if it does not exist.
+
+        Duplicate chunk_ids resolve to the last one in the shards, as in the app.
+        """
+        if self._constitution is not None and chunk_id in self._constitution["by_chunk_id"]:
+            return dict(self._constitution["by_chunk_id"][chunk_id])
+        span = self._build_index().get(chunk_id)
+        if span is None:
+            return None
+        # Copy so callers can't mutate the cached entry.
+        return dict(self._decode(span))
+
+    def get_sections(self, chunk_ids: list[str]) -> list[dict | None]:
+        return [self.get_section(chunk_id) for chunk_id in chunk_ids]
+
+    def get_document_sections(
+        self, doc_id: str, start: int | None = None, end: int | None = None
+    ) -> list[dict]:
+        """Return a document's sections, optionally limited to ordinals start..end (inclusive)."""
+        return list(self.iter_sections(doc_id, start, end))
+
+    def section_count(self, doc_id: str | None = None) -> int:
+        if doc_id is None:
+            constitution = len(self._constitution["sections"]) if self._constitution else 0
+            return self.total_act_sections + constitution
+        if doc_id == self.constitution_doc_id:
+            return len(self._constitution["sections"])
+        self._build_index()
+        return len(self._by_doc_id.get(doc_id, []))
+
+    # -- scans -------------------------------------------------------------
+
+    def iter_documents(self, doc_type: str | None = None) -> Iterator[dict]:
+        for doc in self.documents.values():
+            if doc_type is None or doc.get("doc_type") == doc_type:
+                yield doc
+
+    def iter_sections(
+        self, doc_id: str | None = None, start: int | None = None, end: int | None = None
+    ) -> Iterator[dict]:
+        """Yield sections in corpus order.
+
+        With no doc_id this is a full scan: the Constitution first, then every
+        Acts shard decoded whole, bypassing the LRU cache so a scan doesn't
+        evict the working set. start/end filter on the section ordinal.
+        """
+        def in_range(section: dict) -> bool:
+            ordinal = section.get("ordinal")
+            if start is not None and (ordinal is None or ordinal < start):
+                return False
+            if end is not None and (ordinal is None or ordinal > end):
+                return False
+            return True
+
+        if doc_id is None:
+            if self._constitution is not None:
+                yield from (dict(s) for s in self._constitution["sections"] if in_range(s))
+            if not self._maps:
+                self._open_shards()
+            for mm in self._maps:
+                yield from (s for s in json.loads(mm[:]) if in_range(s))
+            return
+
+        if doc_id == self.constitution_doc_id:
+            yield from (dict(s) for s in self._constitution["sections"] if in_range(s))
+            return
+
+        self._build_index()
+        for span in self._by_doc_id.get(doc_id, []):
+            section = self._decode(span)
+            if in_range(section):
+                yield dict(section)
+
+    def cache_info(self):
+        return self._decode.cache_info()
@@ -0,0 +1,222 @@
+"""Offline TF-IDF retrieval over every parsed section.
+
+Builds BM25-weighted, L2-normalised sparse vectors for all Constitution and
+Acts sections and answers batches of queries with top-k cosine similarity.
+Everything runs locally and is deterministic for a given corpus.
+
+Build the index (written to tools/output/section-tfidf.npz):
+
+    python tools/parse/section_tfidf.py
+
+Query it:
+
+    from section_tfidf import SectionTfidfIndex
+
+    index = SectionTfidfIndex.load()
+    hits = index.query(["freedom of expression", "bail murder"], k=12)
+
+Requires numpy and scipy.
+"""
+
+import re
+import sys
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+from scipy import sparse
+
+from law_corpus import LawCorpus
+
+ROOT = Path(__file__).resolve().parents[2]
+OUTPUT_PATH = ROOT / "tools" / "output" / "section-tfidf.npz"
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Same stop words and term filter as DatabaseService.search (src/db/database.ts),
+# so both retrieval paths see the same query terms.
+STOP_WORDS = {
+    'what', 'are', 'my', 'the', 'a', 'an', 'is', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'up', 'about', 'into', 'through', 'during',
+    'before', 'after', 'above', 'below', 'between', 'under', 'again', 'further',
+    'then', 'once', 'here', 'there', 'when', 'where', 'why', 'how', 'all', 'both',
+    'each', 'few', 'more', 'most', 'other', 'some', 'such', 'only', 'own', 'same',
+    'so', 'than', 'too', 'very', 'can', 'will', 'just', 'should', 'now', 'does',
+    'did', 'has', 'have', 'had', 'do', 'i', 'you', 'he', 'she', 'it', 'we', 'they'
+}
+TOKEN_RE = re.compile(r"[^\W_]+")
+
+
+def tokenize(text: str) -> list[str]:
+    return [
+        term for term in TOKEN_RE.findall(text.lower())
+        if len(term) >= 3 and term not in STOP_WORDS
+    ]
+
+
+def section_text(section: dict) -> str:
+    # Mirrors the indexed columns of sections_fts.
+    return " ".join(
+        str(section.get(key) or "") for key in ("section_number", "heading", "text")
+    )
+
+
+class SearchHit(NamedTuple):
+    chunk_id: str
+    doc_id: str
+    score: float
+
+
+class SectionTfidfIndex:
+    def __init__(
+        self,
+        matrix: sparse.csr_matrix,
+        idf: np.ndarray,
+        vocab: np.ndarray,
+        chunk_ids: np.ndarray,
+        doc_ids: np.ndarray,
+    ) -> None:
+        self.matrix = matrix
+        self.idf = idf
+        self.vocab = vocab
+        self.chunk_ids = chunk_ids
+        self.doc_ids = doc_ids
+        self._term_ids = {term: i for i, term in enumerate(vocab.tolist())}
+        # Transposed once so every query batch is a single CSR x CSC product.
+        self._matrix_t = matrix.T.tocsc()
+
+    @classmethod
+    def build(cls, corpus: LawCorpus) -> "SectionTfidfIndex":
+        # The app imports sections with INSERT OR REPLACE on a unique chunk_id,
+        # so only the last section for each chunk_id is searchable there.
+        sections: dict[str, dict] = {}
+        for section in corpus.iter_sections():
+            sections[section["chunk_id"]] = section
+
+        token_lists = [tokenize(section_text(s)) for s in sections.values()]
+        vocab = np.array(sorted({t for tokens in token_lists for t in tokens}))
+        term_ids = {term: i for i, term in enumerate(vocab.tolist())}
+
+        lengths = np.fromiter((len(tokens) for tokens in token_lists), dtype=np.int64)
+        rows = np.repeat(np.arange(len(token_lists), dtype=np.int32), lengths)
+        cols = np.fromiter(
+            (term_ids[t] for tokens in token_lists for t in tokens),
+            dtype=np.int32,
+            count=int(lengths.sum()),
+        )
+        # Duplicate (row, col) pairs are summed, giving raw term frequencies.
+        tf = sparse.csr_matrix(
+            (np.ones(len(cols), dtype=np.float32), (rows, cols)),
+            shape=(len(token_lists), len(vocab)),
+        )
+        tf.sum_duplicates()
+
+        n_docs = tf.shape[0]
+        df = np.bincount(tf.indices, minlength=len(vocab))
+        idf = np.log1p((n_docs - df + 0.5) / (df + 0.5)).astype(np.float32)
+
+        avg_len = max(float(lengths.mean()), 1.0) if n_docs else 1.0
+        row_len = np.repeat(lengths, np.diff(tf.indptr)).astype(np.float32)
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * row_len / avg_len)
+        tf.data = tf.data * (BM25_K1 + 1) / (tf.data + norm) * idf[tf.indices]
+
+        matrix = _l2_normalize(tf)
+        chunk_ids = np.array(list(sections))
+        doc_ids = np.array([s["doc_id"] for s in sections.values()])
+        return cls(matrix, idf, vocab, chunk_ids, doc_ids)
+
+    @classmethod
+    def load(cls, path: Path = OUTPUT_PATH) -> "SectionTfidfIndex":
+        with np.load(path, allow_pickle=False) as data:
+            matrix = sparse.csr_matrix(
+                (data["data"], data["indices"], data["indptr"]), shape=tuple(data["shape"])
+            )
+            return cls(matrix, data["idf"], data["vocab"], data["chunk_ids"], data["doc_ids"])
+
+    def save(self, path: Path = OUTPUT_PATH) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(
+            path,
+            data=self.matrix.data,
+            indices=self.matrix.indices,
+            indptr=self.matrix.indptr,
+            shape=np.array(self.matrix.shape),
+            idf=self.idf,
+            vocab=self.vocab,
+            chunk_ids=self.chunk_ids,
+            doc_ids=self.doc_ids,
+        )
+
+    def vectorize(self, queries: list[str]) -> sparse.csr_matrix:
+        """Turn queries into L2-normalised, idf-weighted term vectors."""
+        indptr = [0]
+        indices: list[int] = []
+        for query in queries:
+            ids = sorted({self._term_ids[t] for t in tokenize(query) if t in self._term_ids})
+            indices.extend(ids)
+            indptr.append(len(indices))
+        indices_arr = np.array(indices, dtype=np.int32)
+        q = sparse.csr_matrix(
+            (self.idf[indices_arr], indices_arr, np.array(indptr, dtype=np.int32)),
+            shape=(len(queries), len(self.vocab)),
+        )
+        return _l2_normalize(q)
+
+    def query(self, queries: list[str], k: int = 12, batch_size: int = 256) -> list[list[SearchHit]]:
+        """Return the top-k sections for each query, best first.
+
+        Queries are scored in batches with one sparse matrix product each.
+        Sections with no shared terms are never returned, so a result list can
+        be shorter than k. Equal scores are ordered by corpus position.
+        """
+        results: list[list[SearchHit]] = []
+        q = self.vectorize(queries)
+        n_docs = self.matrix.shape[0]
+        k = min(k, n_docs)
+        if k <= 0:
+            return [[] for _ in queries]
+
+        for start in range(0, len(queries), batch_size):
+            scores = (q[start:start + batch_size] @ self._matrix_t).toarray()
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            top_scores = np.take_along_axis(scores, top, axis=1)
+            # Stable sort on (-score, row) keeps the ranking deterministic.
+            order = np.lexsort((top, -top_scores), axis=1)
+            top = np.take_along_axis(top, order, axis=1)
+            top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+            for rows, row_scores in zip(top, top_scores):
+                results.append([
+                    SearchHit(str(self.chunk_ids[i]), str(self.doc_ids[i]), float(score))
+                    for i, score in zip(rows, row_scores)
+                    if score > 0
+                ])
+        return results
+
+
+def _l2_normalize(matrix: sparse.csr_matrix) -> sparse.csr_matrix:
+    matrix = matrix.astype(np.float32)
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return sparse.csr_matrix(sparse.diags(1.0 / norms) @ matrix, dtype=np.float32)
+
+
+def main() -> None:
+    output = Path(sys.argv[1]) if len(sys.argv) > 1 else OUTPUT_PATH
+    started = time.perf_counter()
+    with LawCorpus() as corpus:
+        index = SectionTfidfIndex.build(corpus)
+    index.save(output)
+
+    n_docs, n_terms = index.matrix.shape
+    print(f"sections: {n_docs}")
+    print(f"vocabulary: {n_terms}")
+    print(f"non-zeros: {index.matrix.nnz}")
+    print(f"built in {time.perf_counter() - started:.1f}s")
+    print(f"Wrote TF-IDF index: {output} ({output.stat().st_size / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
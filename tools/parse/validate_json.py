@@ -1,15 +1,14 @@
-import json, re
-from pathlib import Path
+import re
 from collections import Counter
 
-ROOT = Path(__file__).resolve().parents[2]
-JSON_PATH = ROOT / "src" / "assets" / "constitution.json"
+from law_corpus import LawCorpus
 
 def main():
-    data = json.loads(JSON_PATH.read_text(encoding="utf-8"))
-    sections = data.get("sections", [])
-    print("doc_id:", data.get("doc_id"))
-    print("title:", data.get("title"))
+    with LawCorpus() as corpus:
+        doc = corpus.get_document(corpus.constitution_doc_id)
+        sections = list(corpus.iter_sections(corpus.constitution_doc_id))
+    print("doc_id:", doc.get("doc_id"))
+    print("title:", doc.get("title"))
     print("sections:", len(sections))
 
     # basic schema checks